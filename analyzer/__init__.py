@@ -3,38 +3,56 @@ Main evaluation engine for contradiction detection.
 """
 
 import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from .all_rules import get_all_rule_functions
 
-def evaluate(statements):
+def _run_rule(rule_func, statements):
+    """Run one rule, turning a failure into an engine error marker."""
+    try:
+        return rule_func(statements) or []
+    except Exception as e:
+        # Log error but continue with other rules
+        print(f"Warning: Rule {rule_func.__name__} failed: {e}")
+        # Add engine error marker for CI detection
+        return [{
+            'contradiction_id': f'error_{rule_func.__name__}',
+            'type': '__engine_error__',
+            'error': str(e),
+            'rule': rule_func.__name__,
+            'description': f'Rule engine error in {rule_func.__name__}: {e}'
+        }]
+
+def evaluate(statements, parallel=False):
     """
     Main evaluation function that runs all rule functions against statements.
     Returns list of contradictions found.
+    
+    With parallel=True the rules run on a thread pool (they only read the
+    statements); results are still returned in rule order.
     """
+    # No statements means nothing to compare; skip rule discovery entirely
+    if not statements:
+        return []
+    
     contradictions = []
     
     # Get all available rule functions
     rule_functions = get_all_rule_functions()
     
     # Run each rule function against the statements
-    for rule_func in rule_functions:
-        try:
-            rule_contradictions = rule_func(statements)
-            if rule_contradictions:
-                contradictions.extend(rule_contradictions)
-        except Exception as e:
-            # Log error but continue with other rules
-            print(f"Warning: Rule {rule_func.__name__} failed: {e}")
-            # Add engine error marker for CI detection
-            contradictions.append({
-                'contradiction_id': f'error_{rule_func.__name__}',
-                'type': '__engine_error__',
-                'error': str(e),
-                'rule': rule_func.__name__,
-                'description': f'Rule engine error in {rule_func.__name__}: {e}'
-            })
+    if parallel and rule_functions:
+        with ThreadPoolExecutor(max_workers=len(rule_functions)) as executor:
+            results = list(executor.map(lambda rule_func: _run_rule(rule_func, statements), rule_functions))
+    else:
+        results = [_run_rule(rule_func, statements) for rule_func in rule_functions]
+    
+    for rule_contradictions in results:
+        contradictions.extend(rule_contradictions)
     
     return contradictions
 
+@lru_cache(maxsize=1)
 def get_rules_fingerprint():
     """
     Generate a fingerprint of all available rules for metadata.
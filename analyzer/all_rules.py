@@ -2,6 +2,8 @@
 Consolidated import of all analyzer rules with auto-discovery.
 """
 
+from functools import lru_cache as _lru_cache
+
 # Import all rule modules and their functions
 from .rules_dates import *
 from .rules_presence import *
@@ -32,8 +34,13 @@ except Exception:
 __all__ = [k for k in globals().keys() if not k.startswith("_")]
 
 # Get all rule functions for evaluation
+@_lru_cache(maxsize=1)
 def get_all_rule_functions():
-    """Return all rule functions that can be called for contradiction detection."""
+    """
+    Return all rule functions that can be called for contradiction detection.
+    The set of rules is fixed once the modules are imported, so the result is
+    computed once and returned as a tuple.
+    """
     rule_functions = []
     
     # Core rules (always available)
@@ -61,4 +68,4 @@ def get_all_rule_functions():
         if rule_name in globals():
             rule_functions.append(globals()[rule_name])
     
-    return rule_functions
\ No newline at end of file
+    return tuple(rule_functions)
\ No newline at end of file
@@ -3,18 +3,27 @@ ID generation for contradictions with deterministic symmetry.
 """
 import hashlib
 
+_MISSING = object()
+
+def _statement_key(statement):
+    """Return the statement's 'id', falling back to its string representation."""
+    if isinstance(statement, dict):
+        # Only stringify the whole dict when there is no 'id' to use
+        key = statement.get('id', _MISSING)
+        if key is not _MISSING:
+            return key
+    return str(statement)
+
 def contradiction_id(statement_a, statement_b):
     """
     Generate a deterministic contradiction ID that is symmetric.
     contradiction_id(a, b) == contradiction_id(b, a)
     """
-    # Extract statement IDs or use string representation
-    id_a = statement_a.get('id', str(statement_a)) if isinstance(statement_a, dict) else str(statement_a)
-    id_b = statement_b.get('id', str(statement_b)) if isinstance(statement_b, dict) else str(statement_b)
+    id_a = _statement_key(statement_a)
+    id_b = _statement_key(statement_b)
     
-    # Sort to ensure symmetry
-    sorted_ids = sorted([id_a, id_b])
-    combined = "|".join(sorted_ids)
+    # Order the pair to ensure symmetry
+    combined = id_a + "|" + id_b if id_a <= id_b else id_b + "|" + id_a
     
     # Generate hash for deterministic ID
-    return hashlib.sha1(combined.encode()).hexdigest()[:12]
\ No newline at end of file
+    return hashlib.sha1(combined.encode()).hexdigest()[:12]
@@ -2,8 +2,16 @@
 Date range contradiction detection rules.
 """
 
+import re as _re
 from .id import contradiction_id
 from datetime import datetime
+from functools import lru_cache as _lru_cache
+
+# Accepted start/end date formats, tried in order
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d')
+
+# Zero-padded ISO dates, the common case, parsed without strptime (ASCII digits only, like strptime)
+_ISO_DATE_RE = _re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
 
 def date_range_overlap_conflict(statements):
     """
@@ -57,9 +65,23 @@ def date_range_overlap_conflict(statements):
 
 def _parse_date(date_str):
     """Parse date string to datetime object."""
+    if not isinstance(date_str, str):
+        return None
+    return _parse_date_string(date_str)
+
+@_lru_cache(maxsize=4096)
+def _parse_date_string(date_str):
+    """Parse a date string, memoized since the same dates recur across statements."""
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            pass
+    
     try:
         # Try common date formats
-        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d']:
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -4,6 +4,15 @@ Role/responsibility contradiction detection rules.
 
 from .id import contradiction_id
 
+# Role pairs that cannot both describe the same person in one context
+_CONTRADICTORY_ROLE_PAIRS = (
+    ('victim', 'perpetrator'),
+    ('witness', 'suspect'),
+    ('compliant', 'non-compliant'),
+    ('cooperative', 'uncooperative'),
+    ('present', 'absent')
+)
+
 def role_responsibility_conflict(statements):
     """
     Detect conflicts in role assignments or responsibilities.
@@ -56,18 +65,10 @@ def role_responsibility_conflict(statements):
 
 def _roles_contradict(role_a, role_b):
     """Check if two roles are contradictory."""
-    contradictory_pairs = [
-        ('victim', 'perpetrator'),
-        ('witness', 'suspect'),
-        ('compliant', 'non-compliant'),
-        ('cooperative', 'uncooperative'),
-        ('present', 'absent')
-    ]
-    
     role_a_lower = role_a.lower()
     role_b_lower = role_b.lower()
     
-    for pair in contradictory_pairs:
+    for pair in _CONTRADICTORY_ROLE_PAIRS:
         if (role_a_lower in pair[0] and role_b_lower in pair[1]) or \
            (role_a_lower in pair[1] and role_b_lower in pair[0]):
             return True
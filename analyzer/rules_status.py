@@ -4,6 +4,14 @@ Status change contradiction detection rules.
 
 from .id import contradiction_id
 
+# Status pairs that cannot both be true for the same case
+_CONTRADICTORY_STATUS_PAIRS = (
+    ('ACTIVE', 'CLOSED'),
+    ('OPEN', 'CLOSED'),
+    ('SUBSTANTIATED', 'UNSUBSTANTIATED'),
+    ('FOUNDED', 'UNFOUNDED')
+)
+
 def status_change_inconsistency(statements):
     """
     Detect inconsistent status changes.
@@ -25,14 +33,7 @@ def status_change_inconsistency(statements):
     
     # Check for contradictory statuses
     for case_key, status_groups in cases.items():
-        contradictory_pairs = [
-            ('ACTIVE', 'CLOSED'),
-            ('OPEN', 'CLOSED'),
-            ('SUBSTANTIATED', 'UNSUBSTANTIATED'),
-            ('FOUNDED', 'UNFOUNDED')
-        ]
-        
-        for status_a, status_b in contradictory_pairs:
+        for status_a, status_b in _CONTRADICTORY_STATUS_PAIRS:
             if status_a in status_groups and status_b in status_groups:
                 stmts_a = status_groups[status_a]
                 stmts_b = status_groups[status_b]
@@ -156,7 +156,10 @@ def check_data_files():
     data_dir = REPO_ROOT / "public" / "data"
     expected_files = [
         'contradictions.json',
-        'run_meta.json',
+        'run_meta.json'
+    ]
+    # Only written by run_analysis.py --debug-statements
+    optional_files = [
         'statements_debug.json'
     ]
     
@@ -175,6 +178,12 @@ def check_data_files():
             print(f"❌ {filename} (MISSING)")
             missing.append(filename)
     
+    for filename in optional_files:
+        if (data_dir / filename).exists():
+            print(f"✅ {filename}")
+        else:
+            print(f"ℹ️ {filename} (optional, written with --debug-statements)")
+    
     if missing:
         print("💡 Generate missing files with: python scripts/run_analysis.py --demo")
         return False
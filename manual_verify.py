@@ -154,7 +154,7 @@ def test_run_analysis():
     
     # Test with demo mode
     success, output = run_command(
-        "python scripts/run_analysis.py --demo",
+        "python scripts/run_analysis.py --demo --debug-statements",
         "Running analysis with demo data",
         check_output=True
     )
@@ -0,0 +1,61 @@
+"""
+Shared helpers for the standalone pipeline check scripts
+(test_complete_pipeline.py and test_manual_verification.py).
+"""
+import csv
+import functools
+import json
+import mmap
+import os
+from pathlib import Path
+from datetime import datetime, timezone
+
+# Timestamp recorded in run_meta.json; taken once at import
+RUN_TIMESTAMP = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@functools.cache
+def get_output_dir():
+    """Return the output directory, creating it on first use only."""
+    path = Path("public/data")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def dump(path, obj):
+    """Write obj to path as indented JSON in a single write."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2), encoding='utf-8')
+
+def load(path):
+    """Read a JSON file, parsing straight from a mapped view when orjson is available."""
+    if orjson is not None:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return orjson.loads(view)
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+def probe(path):
+    """Return (exists, size in bytes) for path with a single stat call."""
+    try:
+        return True, os.stat(path).st_size
+    except OSError:
+        return False, 0
+
+def csv_ids_unique(path):
+    """Return (rows read, first duplicated contradiction_id or None) for a scored CSV."""
+    seen = set()
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            cid = row.get('contradiction_id', '')
+            if cid in seen:
+                return len(seen) + 1, cid
+            seen.add(cid)
+    return len(seen), None
@@ -94,7 +94,6 @@ def verify_output_files():
     
     files_to_check = [
         (OUTPUT_DIR / "contradictions.json", "contradictions.json", "json"),
-        (OUTPUT_DIR / "statements_debug.json", "statements_debug.json", "json"),
         (OUTPUT_DIR / "run_meta.json", "run_meta.json", "json"),
         (OUTPUT_DIR / "contradictions_scored.json", "contradictions_scored.json", "json"),
         (OUTPUT_DIR / "contradictions_scored.csv", "contradictions_scored.csv", "csv")
@@ -110,6 +109,14 @@ def verify_output_files():
             if not check_csv_file(filepath, description):
                 all_valid = False
     
+    # Only written by run_analysis.py --debug-statements
+    debug_file = OUTPUT_DIR / "statements_debug.json"
+    if debug_file.exists():
+        if not check_file_valid_json(debug_file, "statements_debug.json"):
+            all_valid = False
+    else:
+        print("ℹ️ statements_debug.json not written (optional, --debug-statements)")
+    
     return all_valid
 
 def run_analysis():
@@ -117,7 +124,7 @@ def run_analysis():
     print("\n🧠 Running contradiction analysis...")
     
     success, stdout, stderr = run_command(
-        f"python scripts/run_analysis.py --demo",
+        f"python scripts/run_analysis.py --demo --debug-statements",
         "Running analysis with demo data",
         timeout=30
     )
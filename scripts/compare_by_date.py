@@ -30,7 +30,7 @@ import json
 import os
 import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -50,12 +50,22 @@ DATE_PATTERNS = [
     # YYYY-MM-DD
     r"\b(20\d{2}|19\d{2})-(0?[1-9]|1[0-2])-(0?[1-9]|[12]\d|3[01])\b",
 ]
+# Compiled body-date patterns (same order/priority as DATE_PATTERNS)
+_DATE_RES = [re.compile(pat) for pat in DATE_PATTERNS]
 FILENAME_DATE_PATTERNS = [
     # 12.10.20 or 1.5.2016
     r"\b(0?[1-9]|1[0-2])[.\-](0?[1-9]|[12]\d|3[01])[.\-]((?:20)?\d{2})\b",
     # 2020-02-26
     r"\b(20\d{2}|19\d{2})[-_](0?[1-9]|1[0-2])[-_](0?[1-9]|[12]\d|3[01])\b",
 ]
+_FILENAME_DATE_RES = [re.compile(pat) for pat in FILENAME_DATE_PATTERNS]
+# PDF CreationDate like D:20200226...
+_META_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+
+MONTH_NUMBERS = {
+    "January": 1, "February": 2, "March": 3, "April": 4, "May": 5, "June": 6,
+    "July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12,
+}
 
 # --- Utilities ---
 def sha256(path: Path) -> str:
@@ -108,11 +118,7 @@ def to_iso_date(mo: re.Match, pattern_idx: int) -> str:
     if pattern_idx == 1:
         # Month DD, YYYY
         month_name, d, y = mo.group(1), mo.group(2), mo.group(3)
-        month_num = {
-            "January":1,"February":2,"March":3,"April":4,"May":5,"June":6,
-            "July":7,"August":8,"September":9,"October":10,"November":11,"December":12
-        }[month_name]
-        return dt.date(int(y), month_num, int(d)).isoformat()
+        return dt.date(int(y), MONTH_NUMBERS[month_name], int(d)).isoformat()
     if pattern_idx == 2:
         # YYYY-MM-DD
         y, m, d = mo.group(1), mo.group(2), mo.group(3)
@@ -132,16 +138,16 @@ def to_iso_from_filename(mo: re.Match, pattern: str) -> str:
 
 def extract_date(text: str, filename: str, pdf_meta_date: str | None) -> str | None:
     # 1) from body text
-    for idx, pat in enumerate(DATE_PATTERNS):
-        m = re.search(pat, text)
+    for idx, date_re in enumerate(_DATE_RES):
+        m = date_re.search(text)
         if m:
             try:
                 return to_iso_date(m, idx)
             except Exception:
                 pass
     # 2) from filename
-    for pat in FILENAME_DATE_PATTERNS:
-        m = re.search(pat, filename)
+    for pat, pat_re in zip(FILENAME_DATE_PATTERNS, _FILENAME_DATE_RES):
+        m = pat_re.search(filename)
         if m:
             try:
                 return to_iso_from_filename(m, pat)
@@ -149,7 +155,7 @@ def extract_date(text: str, filename: str, pdf_meta_date: str | None) -> str | N
                 pass
     # 3) from metadata: CreationDate like D:20200226...
     if pdf_meta_date:
-        m = re.search(r"(\d{4})(\d{2})(\d{2})", pdf_meta_date)
+        m = _META_DATE_RE.search(pdf_meta_date)
         if m:
             y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
             try:
@@ -295,9 +301,10 @@ def main():
     csv_rows: List[Dict[str, str | int]] = []
     index_items: List[str] = []
 
-    # Index heading
+    # Index heading (one pass over the scanned paths for the per-type counts)
+    suffix_counts = Counter(p.suffix.lower() for p in pdfs)
     index_body = [f"<h1>Date-based Diff Index</h1>",
-                  f"<p>Total documents scanned: <b>{len(pdfs)}</b> ({len([p for p in pdfs if p.suffix.lower() == '.pdf'])} PDFs, {len([p for p in pdfs if p.suffix.lower() == '.txt'])} text files). Dated groups: <b>{len(groups)}</b>. Unknown date: <b>{len(unknowns)}</b>.</p>"]
+                  f"<p>Total documents scanned: <b>{len(pdfs)}</b> ({suffix_counts['.pdf']} PDFs, {suffix_counts['.txt']} text files). Dated groups: <b>{len(groups)}</b>. Unknown date: <b>{len(unknowns)}</b>.</p>"]
 
     # Process each date with 2+ documents
     for date, ds in sorted(groups.items()):
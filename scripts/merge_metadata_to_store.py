@@ -1,6 +1,12 @@
 import json
 from pathlib import Path
 
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 META = ROOT / "output" / "metadata"
 STORE = ROOT / "app" / "data" / "justice-documents.json"
@@ -31,8 +37,12 @@ def main():
             "textContent": j.get("description", "")[:10000]  # Use description as text content preview
         })
     
-    with open(STORE, "w", encoding="utf-8") as f:
-        json.dump(docs, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson always emits UTF-8, so non-ASCII text is written as-is like ensure_ascii=False
+        STORE.write_bytes(orjson.dumps(docs, option=orjson.OPT_INDENT_2))
+    else:
+        with open(STORE, "w", encoding="utf-8") as f:
+            f.write(json.dumps(docs, ensure_ascii=False, indent=2))
     print(f"Wrote {STORE} ({len(docs)} items)")
 
 if __name__ == "__main__":
@@ -7,16 +7,22 @@ Processes statements and outputs contradictions with metadata.
 import json
 import os
 import sys
-import subprocess
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import analyzer early to register all rules
 import analyzer
 from analyzer import evaluate, get_rules_fingerprint
 
 def get_git_sha():
     """Get current git SHA, or None if not available."""
+    import subprocess  # only needed here; keep it off the startup path
     try:
         result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
                               capture_output=True, text=True, timeout=5)
@@ -26,6 +32,13 @@ def get_git_sha():
         pass
     return None
 
+def write_json(path, data):
+    """Write data to path as indented JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        path.write_text(json.dumps(data, indent=2, default=str), encoding='utf-8')
+
 def load_demo_statements():
     """Generate demo statements for testing."""
     return [
@@ -75,6 +88,7 @@ def main():
     """Main analysis execution."""
     # Parse arguments
     demo_mode = '--demo' in sys.argv
+    debug_statements = '--debug-statements' in sys.argv
     
     if demo_mode:
         print("Running in demo mode...")
@@ -91,8 +105,9 @@ def main():
     contradictions = evaluate(statements)
     
     # Filter out engine errors for counting
-    real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-    engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+    real_contradictions, engine_errors = [], []
+    for c in contradictions:
+        (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
     
     print(f"Found {len(real_contradictions)} contradictions")
     if engine_errors:
@@ -104,19 +119,18 @@ def main():
     
     # Write contradictions.json
     contradictions_file = output_dir / "contradictions.json"
-    with open(contradictions_file, 'w') as f:
-        json.dump(contradictions, f, indent=2, default=str)
+    write_json(contradictions_file, contradictions)
     print(f"Wrote contradictions to {contradictions_file}")
     
-    # Write statements debug file
-    statements_file = output_dir / "statements_debug.json" 
-    with open(statements_file, 'w') as f:
-        json.dump(statements, f, indent=2, default=str)
-    print(f"Wrote debug statements to {statements_file}")
+    # Write statements debug file (opt-in; only needed when debugging rules)
+    if debug_statements:
+        statements_file = output_dir / "statements_debug.json"
+        write_json(statements_file, statements)
+        print(f"Wrote debug statements to {statements_file}")
     
     # Write run metadata
     run_meta = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "git_sha": get_git_sha(),
         "num_statements": len(statements),
         "num_contradictions": len(real_contradictions),
@@ -124,8 +138,7 @@ def main():
     }
     
     meta_file = output_dir / "run_meta.json"
-    with open(meta_file, 'w') as f:
-        json.dump(run_meta, f, indent=2)
+    write_json(meta_file, run_meta)
     print(f"Wrote run metadata to {meta_file}")
     
     # Final status
@@ -80,7 +80,7 @@ def generate_integration_summary(output_dir: str):
     # Write summary for pipeline integration
     summary_path = output_path / 'detection_summary.json'
     with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
+        f.write(json.dumps(summary, indent=2))
     
     print(f"Integration summary written to: {summary_path}")
     
@@ -6,96 +6,154 @@ Loads contradictions.json and produces scored outputs with deduplication.
 
 import json
 import csv
+import heapq
+import io
+import mmap
+import os
+import re
+import sys
+from operator import itemgetter
 from pathlib import Path
 
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def load_contradictions():
     """Load contradictions from analysis output."""
     contradictions_file = Path("public/data/contradictions.json")
-    if not contradictions_file.exists():
+    try:
+        if orjson is not None:
+            # Parse straight from the mapped file instead of copying it into a bytes object first
+            with open(contradictions_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(contradictions_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
         print("Error: contradictions.json not found. Run run_analysis.py first.")
         return []
+
+# Base score per contradiction type
+BASE_SCORES = {
+    'presence_absence_conflict': 85,
+    'event_date_disagreement': 75, 
+    'numeric_amount_mismatch': 80,
+    'status_change_inconsistency': 90,
+    'location_contradiction': 70,
+    'role_responsibility_conflict': 65,
+    'date_range_overlap_conflict': 60,
+    '__engine_error__': 0
+}
+
+# Substrings marking high-impact locations and roles
+_LOCATION_KEYWORDS_RE = re.compile(r'court|hospital|police|office')
+_ROLE_KEYWORDS_RE = re.compile(r'victim|perpetrator|witness|suspect')
+
+# Status pairs (either order) that count as high-impact changes
+_HIGH_IMPACT_STATUS_PAIRS = frozenset({
+    frozenset({'ACTIVE', 'CLOSED'}),
+    frozenset({'SUBSTANTIATED', 'UNSUBSTANTIATED'}),
+})
+
+def _adjust_status(contradiction):
+    """Status rule adjustments."""
+    statuses = frozenset((contradiction.get('status_a', '').upper(),
+                          contradiction.get('status_b', '').upper()))
+    if statuses in _HIGH_IMPACT_STATUS_PAIRS:
+        return 10  # High-impact status changes
+    return 0
+
+def _adjust_location(contradiction):
+    """Location rule adjustments."""
+    location_a = contradiction.get('location_a', '').lower()
+    location_b = contradiction.get('location_b', '').lower()
     
-    with open(contradictions_file, 'r') as f:
-        return json.load(f)
+    if _LOCATION_KEYWORDS_RE.search(location_a) or _LOCATION_KEYWORDS_RE.search(location_b):
+        return 15  # Important institutional locations
+    return 0
+
+def _adjust_role(contradiction):
+    """Role rule adjustments."""
+    role_a = contradiction.get('role_a', '').lower()
+    role_b = contradiction.get('role_b', '').lower()
+    
+    if _ROLE_KEYWORDS_RE.search(role_a) or _ROLE_KEYWORDS_RE.search(role_b):
+        return 20  # Critical role contradictions
+    return 0
+
+def _adjust_date_range(contradiction):
+    """Date range rule adjustments."""
+    range_a = contradiction.get('range_a', '')
+    range_b = contradiction.get('range_b', '')
+    
+    if range_a and range_b:
+        return 5  # Minor boost for valid date ranges
+    return 0
+
+# Content-based score adjustment for each contradiction type that has one
+SCORE_ADJUSTERS = {
+    'status_change_inconsistency': _adjust_status,
+    'location_contradiction': _adjust_location,
+    'role_responsibility_conflict': _adjust_role,
+    'date_range_overlap_conflict': _adjust_date_range,
+}
 
 def score_contradiction(contradiction):
     """Assign scores to contradictions based on type and severity."""
-    base_scores = {
-        'presence_absence_conflict': 85,
-        'event_date_disagreement': 75, 
-        'numeric_amount_mismatch': 80,
-        'status_change_inconsistency': 90,
-        'location_contradiction': 70,
-        'role_responsibility_conflict': 65,
-        'date_range_overlap_conflict': 60,
-        '__engine_error__': 0
-    }
-    
     contradiction_type = contradiction.get('type', 'unknown')
-    base_score = base_scores.get(contradiction_type, 50)
+    base_score = BASE_SCORES.get(contradiction_type, 50)
     
     # Apply adjustments based on content
-    adjustments = 0
-    
-    # Status rule adjustments
-    if contradiction_type == 'status_change_inconsistency':
-        status_a = contradiction.get('status_a', '').upper()
-        status_b = contradiction.get('status_b', '').upper()
-        
-        if ('ACTIVE' in [status_a, status_b] and 'CLOSED' in [status_a, status_b]) or \
-           ('SUBSTANTIATED' in [status_a, status_b] and 'UNSUBSTANTIATED' in [status_a, status_b]):
-            adjustments += 10  # High-impact status changes
-    
-    # Location rule adjustments
-    elif contradiction_type == 'location_contradiction':
-        location_a = contradiction.get('location_a', '').lower()
-        location_b = contradiction.get('location_b', '').lower()
-        
-        if any(word in location_a or word in location_b for word in ['court', 'hospital', 'police', 'office']):
-            adjustments += 15  # Important institutional locations
-    
-    # Role rule adjustments 
-    elif contradiction_type == 'role_responsibility_conflict':
-        role_a = contradiction.get('role_a', '').lower()
-        role_b = contradiction.get('role_b', '').lower()
-        
-        if any(word in role_a or word in role_b for word in ['victim', 'perpetrator', 'witness', 'suspect']):
-            adjustments += 20  # Critical role contradictions
-    
-    # Date range rule adjustments
-    elif contradiction_type == 'date_range_overlap_conflict':
-        range_a = contradiction.get('range_a', '')
-        range_b = contradiction.get('range_b', '')
-        
-        if range_a and range_b:
-            adjustments += 5  # Minor boost for valid date ranges
+    adjuster = SCORE_ADJUSTERS.get(contradiction_type)
+    adjustments = adjuster(contradiction) if adjuster else 0
     
     final_score = min(100, max(0, base_score + adjustments))
     return final_score
 
-def write_outputs(contradictions):
-    """Write scored contradictions to JSON and CSV files with deduplication."""
-    # De-duplicate by contradiction_id
-    uniq = {}
-    for c in contradictions:
-        cid = c.get("contradiction_id") or id(c)
-        uniq[cid] = c
-    items = list(uniq.values())
+def write_outputs(contradictions, pretty=False, top_k=0):
+    """
+    Write scored contradictions to JSON and CSV files with deduplication.
+    JSON is written compact unless pretty is set; only the top_k highest
+    scores are kept when top_k > 0.
+    """
+    # De-duplicate by contradiction_id (last occurrence wins)
+    items = list({(c.get("contradiction_id") or id(c)): c for c in contradictions}.values())
     
     # Score each contradiction
     for item in items:
         item['score'] = score_contradiction(item)
     
-    # Sort by score (highest first)
-    items.sort(key=lambda x: x.get('score', 0), reverse=True)
+    # Sort by score (highest first), keeping only the top K if requested
+    if top_k > 0:
+        items = heapq.nlargest(top_k, items, key=itemgetter('score'))
+    else:
+        items.sort(key=itemgetter('score'), reverse=True)
     
     output_dir = Path("public/data")
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Write scored JSON
     json_file = output_dir / "contradictions_scored.json"
-    with open(json_file, 'w') as f:
-        json.dump(items, f, indent=2, default=str)
+    if orjson is not None and pretty:
+        json_file.write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2, default=str))
+    elif orjson is not None:
+        # Stream the array one item at a time so the encoded document is never held in memory
+        with open(json_file, 'wb', buffering=1024 * 1024) as f:
+            f.write(b'[')
+            for i, item in enumerate(items):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(item, default=str))
+            f.write(b']')
+    else:
+        if pretty:
+            text = json.dumps(items, indent=2, default=str)
+        else:
+            text = json.dumps(items, separators=(',', ':'), default=str)
+        json_file.write_text(text, encoding='utf-8')
     print(f"Wrote scored contradictions to {json_file}")
     
     # Write CSV
@@ -108,21 +166,32 @@ def write_outputs(contradictions):
             'status_a', 'status_b', 'role_a', 'role_b'
         ]
         
+        # Format the whole CSV in memory and write it to disk once
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        
+        # Create clean rows with only the fields we want
+        rows = [[item.get(field, '') for field in fieldnames] for item in items]
+        writer.writerows(rows)
+        
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            
-            for item in items:
-                # Create a clean row with only the fields we want
-                row = {}
-                for field in fieldnames:
-                    row[field] = item.get(field, '')
-                writer.writerow(row)
+            f.write(buffer.getvalue())
     
     print(f"Wrote CSV to {csv_file} with {len(items)} unique contradictions")
 
 def main():
     """Main scoring execution."""
+    # Only keep the K highest-scored contradictions when JUSTICE_TOP_K is set (0 = keep all)
+    raw_top_k = os.environ.get('JUSTICE_TOP_K', '').strip() or '0'
+    try:
+        top_k = int(raw_top_k)
+    except ValueError:
+        top_k = -1
+    if top_k < 0:
+        print(f"Error: JUSTICE_TOP_K must be a non-negative integer, got {raw_top_k!r}")
+        return 1
+    
     print("Loading contradictions for scoring...")
     contradictions = load_contradictions()
     
@@ -130,12 +199,15 @@ def main():
         print("No contradictions to score.")
         return 1
     
+    # Indented JSON is only for humans; the frontend reads the compact form
+    pretty = ('--pretty' in sys.argv
+              or os.environ.get('JUSTICE_PRETTY_JSON', '').strip().lower() in {'1', 'true', 'yes'})
+    
     print(f"Scoring {len(contradictions)} contradictions...")
-    write_outputs(contradictions)
+    write_outputs(contradictions, pretty=pretty, top_k=top_k)
     
     print("✅ Scoring completed successfully")
     return 0
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
\ No newline at end of file
@@ -1,12 +1,8 @@
 """
 Direct test of analyzer functionality
 """
-import sys
 import os
-from pathlib import Path
-
-# Add current directory to path
-sys.path.insert(0, str(Path.cwd()))
+from collections import Counter
 
 print("🔍 Testing analyzer import...")
 
@@ -38,8 +34,9 @@ try:
     print(f"✅ Evaluation successful: {len(contradictions)} results")
     
     # Filter out engine errors
-    real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-    engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+    real_contradictions, engine_errors = [], []
+    for c in contradictions:
+        (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
     
     print(f"  - {len(real_contradictions)} valid contradictions")
     print(f"  - {len(engine_errors)} engine errors")
@@ -48,14 +45,12 @@ try:
         for error in engine_errors:
             print(f"    ⚠️ {error.get('rule', 'unknown')}: {error.get('error', 'unknown error')}")
     
-    # Test a few expected contradictions
-    presence_conflicts = [c for c in real_contradictions if c.get('type') == 'presence_absence_conflict']
-    date_conflicts = [c for c in real_contradictions if c.get('type') == 'event_date_disagreement']
-    amount_conflicts = [c for c in real_contradictions if c.get('type') == 'numeric_amount_mismatch']
+    # Test a few expected contradictions (count every type in one pass)
+    type_counts = Counter(c.get('type') for c in real_contradictions)
     
-    print(f"  - {len(presence_conflicts)} presence conflicts")
-    print(f"  - {len(date_conflicts)} date conflicts")
-    print(f"  - {len(amount_conflicts)} amount conflicts")
+    print(f"  - {type_counts['presence_absence_conflict']} presence conflicts")
+    print(f"  - {type_counts['event_date_disagreement']} date conflicts")
+    print(f"  - {type_counts['numeric_amount_mismatch']} amount conflicts")
     
     # Test ID symmetry
     id1 = contradiction_id(statements[0], statements[1])
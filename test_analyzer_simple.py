@@ -4,8 +4,6 @@ Simple test of analyzer functionality.
 """
 
 import sys
-import os
-sys.path.insert(0, os.getcwd())
 
 # Test analyzer imports
 try:
@@ -30,8 +28,9 @@ print(f"Testing with {len(statements)} statements...")
 
 # Run evaluation
 contradictions = evaluate(statements)
-real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+real_contradictions, engine_errors = [], []
+for c in contradictions:
+    (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
 
 print(f"✅ Found {len(real_contradictions)} contradictions")
 if engine_errors:
@@ -1,15 +1,13 @@
 """
 Complete pipeline test - imports, execution, and file creation
 """
-import sys
-import os
-import json
 import csv
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
 
-# Add current directory to path
-sys.path.insert(0, str(Path.cwd()))
+from pipeline_check_utils import (
+    RUN_TIMESTAMP, csv_ids_unique, dump, get_output_dir, load, probe,
+)
 
 def test_analyzer():
     """Test analyzer functionality"""
@@ -43,8 +41,9 @@ def test_analyzer():
         print(f"✅ Evaluation successful: {len(contradictions)} results")
         
         # Filter out engine errors
-        real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-        engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+        real_contradictions, engine_errors = [], []
+        for c in contradictions:
+            (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
         
         print(f"  - {len(real_contradictions)} valid contradictions")
         print(f"  - {len(engine_errors)} engine errors")
@@ -79,25 +78,22 @@ def test_file_outputs(contradictions, statements):
     print("\n🔧 Testing file output simulation...")
     
     # Create output directory
-    output_dir = Path("public/data")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = get_output_dir()
     
     # Write contradictions.json
     contradictions_file = output_dir / "contradictions.json"
-    with open(contradictions_file, 'w') as f:
-        json.dump(contradictions, f, indent=2, default=str)
+    dump(contradictions_file, contradictions)
     print(f"✅ Wrote {contradictions_file}")
     
     # Write statements debug
     statements_file = output_dir / "statements_debug.json"
-    with open(statements_file, 'w') as f:
-        json.dump(statements, f, indent=2, default=str)
+    dump(statements_file, statements)
     print(f"✅ Wrote {statements_file}")
     
     # Write run metadata
     real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
     run_meta = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": RUN_TIMESTAMP,
         "git_sha": None,
         "num_statements": len(statements),
         "num_contradictions": len(real_contradictions),
@@ -105,46 +101,36 @@ def test_file_outputs(contradictions, statements):
     }
     
     meta_file = output_dir / "run_meta.json"
-    with open(meta_file, 'w') as f:
-        json.dump(run_meta, f, indent=2)
+    dump(meta_file, run_meta)
     print(f"✅ Wrote {meta_file}")
     
     # Test scoring (simulate scoding.py)
     print("\n🔧 Testing scoring simulation...")
     
     # De-duplicate by contradiction_id
-    uniq = {}
-    for c in contradictions:
-        cid = c.get("contradiction_id") or id(c)
-        uniq[cid] = c
-    items = list(uniq.values())
+    items = list({(c.get("contradiction_id") or id(c)): c for c in contradictions}.values())
     
     # Simple scoring
     for item in items:
         item['score'] = 75
     
-    items.sort(key=lambda x: x.get('score', 0), reverse=True)
+    items.sort(key=itemgetter('score'), reverse=True)
     
     # Write scored JSON
     json_file = output_dir / "contradictions_scored.json"
-    with open(json_file, 'w') as f:
-        json.dump(items, f, indent=2, default=str)
+    dump(json_file, items)
     print(f"✅ Wrote {json_file}")
     
     # Write CSV
     csv_file = output_dir / "contradictions_scored.csv"
     if items:
-        fieldnames = ['contradiction_id', 'type', 'score', 'description']
+        fieldnames = ('contradiction_id', 'type', 'score', 'description')
+        rows = [[item.get(field, '') for field in fieldnames] for item in items]
         
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            
-            for item in items:
-                row = {}
-                for field in fieldnames:
-                    row[field] = item.get(field, '')
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
     
     print(f"✅ Wrote {csv_file} with {len(items)} unique contradictions")
     
@@ -165,9 +151,8 @@ def verify_outputs():
     all_good = True
     
     for file_path in expected_files:
-        full_path = Path(file_path)
-        if full_path.exists():
-            size = full_path.stat().st_size
+        exists, size = probe(file_path)
+        if exists:
             print(f"✅ {file_path} exists ({size} bytes)")
         else:
             print(f"❌ {file_path} missing")
@@ -176,8 +161,7 @@ def verify_outputs():
     # Check for engine errors
     contradictions_file = Path("public/data/contradictions.json")
     if contradictions_file.exists():
-        with open(contradictions_file, 'r') as f:
-            data = json.load(f)
+        data = load(contradictions_file)
         
         engine_errors = [item for item in data if item.get('type') == '__engine_error__']
         if engine_errors:
@@ -189,19 +173,12 @@ def verify_outputs():
     # Check CSV for duplicates
     csv_file = Path("public/data/contradictions_scored.csv")
     if csv_file.exists():
-        contradiction_ids = []
+        row_count, duplicate_id = csv_ids_unique(csv_file)
         
-        with open(csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                contradiction_ids.append(row.get('contradiction_id', ''))
-        
-        unique_ids = set(contradiction_ids)
-        
-        if len(contradiction_ids) == len(unique_ids):
-            print(f"✅ CSV has {len(contradiction_ids)} unique contradiction_id rows")
+        if duplicate_id is None:
+            print(f"✅ CSV has {row_count} unique contradiction_id rows")
         else:
-            print(f"❌ CSV has duplicates: {len(contradiction_ids)} total, {len(unique_ids)} unique")
+            print(f"❌ CSV has duplicates: {duplicate_id!r} repeats at row {row_count}")
             all_good = False
     
     return all_good
@@ -34,8 +34,9 @@ statements = [
 
 try:
     contradictions = evaluate(statements)
-    real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-    engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+    real_contradictions, engine_errors = [], []
+    for c in contradictions:
+        (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
     
     print(f"✅ Evaluation completed: {len(real_contradictions)} contradictions, {len(engine_errors)} errors")
     
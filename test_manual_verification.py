@@ -3,14 +3,14 @@
 Inline manual verification of the complete analyzer pipeline.
 """
 
-import json
-import os
+import csv
 import sys
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
 
-# Ensure we can import our modules
-sys.path.insert(0, str(Path.cwd()))
+from pipeline_check_utils import (
+    RUN_TIMESTAMP, csv_ids_unique, dump, get_output_dir, load, probe,
+)
 
 def main():
     """Run the complete verification inline."""
@@ -63,22 +63,19 @@ def main():
     print("\n🔧 Testing file output simulation...")
     
     # Create output directory
-    output_dir = Path("public/data")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = get_output_dir()
     
     # Write test files
     contradictions_file = output_dir / "contradictions.json"
-    with open(contradictions_file, 'w') as f:
-        json.dump(contradictions, f, indent=2, default=str)
+    dump(contradictions_file, contradictions)
     print(f"✅ Wrote {contradictions_file}")
     
     statements_file = output_dir / "statements_debug.json"
-    with open(statements_file, 'w') as f:
-        json.dump(statements, f, indent=2, default=str)
+    dump(statements_file, statements)
     print(f"✅ Wrote {statements_file}")
     
     run_meta = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": RUN_TIMESTAMP,
         "git_sha": None,
         "num_statements": len(statements),
         "num_contradictions": len(real_contradictions),
@@ -86,47 +83,36 @@ def main():
     }
     
     meta_file = output_dir / "run_meta.json"
-    with open(meta_file, 'w') as f:
-        json.dump(run_meta, f, indent=2)
+    dump(meta_file, run_meta)
     print(f"✅ Wrote {meta_file}")
     
     # Step 4: Test scoring and CSV output
     print("\n🔧 Testing scoring simulation...")
     
     # De-duplicate by contradiction_id
-    uniq = {}
-    for c in contradictions:
-        cid = c.get("contradiction_id") or id(c)
-        uniq[cid] = c
-    items = list(uniq.values())
+    items = list({(c.get("contradiction_id") or id(c)): c for c in contradictions}.values())
     
     # Simple scoring
     for item in items:
         item['score'] = 75
     
-    items.sort(key=lambda x: x.get('score', 0), reverse=True)
+    items.sort(key=itemgetter('score'), reverse=True)
     
     # Write scored JSON
     json_file = output_dir / "contradictions_scored.json"
-    with open(json_file, 'w') as f:
-        json.dump(items, f, indent=2, default=str)
+    dump(json_file, items)
     print(f"✅ Wrote {json_file}")
     
     # Write CSV
     csv_file = output_dir / "contradictions_scored.csv"
     if items:
-        import csv
-        fieldnames = ['contradiction_id', 'type', 'score', 'description']
+        fieldnames = ('contradiction_id', 'type', 'score', 'description')
+        rows = [[item.get(field, '') for field in fieldnames] for item in items]
         
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            
-            for item in items:
-                row = {}
-                for field in fieldnames:
-                    row[field] = item.get(field, '')
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
     
     print(f"✅ Wrote {csv_file} with {len(items)} unique contradictions")
     
@@ -144,17 +130,15 @@ def main():
     all_good = True
     
     for file_path in expected_files:
-        full_path = Path(file_path)
-        if full_path.exists():
-            size = full_path.stat().st_size
+        exists, size = probe(file_path)
+        if exists:
             print(f"✅ {file_path} exists ({size} bytes)")
         else:
             print(f"❌ {file_path} missing")
             all_good = False
     
     # Check for engine errors
-    with open(contradictions_file, 'r') as f:
-        data = json.load(f)
+    data = load(contradictions_file)
     
     engine_errors = [item for item in data if item.get('type') == '__engine_error__']
     if engine_errors:
@@ -164,20 +148,12 @@ def main():
         print("✅ No engine errors found")
     
     # Check CSV for duplicates
-    import csv
-    contradiction_ids = []
+    row_count, duplicate_id = csv_ids_unique(csv_file)
     
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            contradiction_ids.append(row.get('contradiction_id', ''))
-    
-    unique_ids = set(contradiction_ids)
-    
-    if len(contradiction_ids) == len(unique_ids):
-        print(f"✅ CSV has {len(contradiction_ids)} unique contradiction_id rows")
+    if duplicate_id is None:
+        print(f"✅ CSV has {row_count} unique contradiction_id rows")
     else:
-        print(f"❌ CSV has duplicates: {len(contradiction_ids)} total, {len(unique_ids)} unique")
+        print(f"❌ CSV has duplicates: {duplicate_id!r} repeats at row {row_count}")
         all_good = False
     
     if all_good:
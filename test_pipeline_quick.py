@@ -8,9 +8,23 @@ import os
 import json
 from pathlib import Path
 
-# Add repo root to Python path
+# orjson is optional; fall back to the stdlib decoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Repo root (the script's own directory is already first on sys.path)
 repo_root = Path(__file__).resolve().parent
-sys.path.insert(0, str(repo_root))
+
+# Summary marker and label per test outcome
+_STATUS = {True: ("✅", "PASS"), False: ("❌", "FAIL")}
+
+def _loads(raw):
+    """Parse JSON from raw file bytes (orjson errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
 
 def test_analyzer_import():
     """Test that analyzer package imports correctly"""
@@ -86,25 +100,31 @@ def test_data_files():
     
     required_files = [
         "contradictions.json",
-        "run_meta.json", 
+        "run_meta.json"
+    ]
+    
+    # Only written by run_analysis.py --debug-statements
+    optional_files = [
         "statements_debug.json"
     ]
     
     all_good = True
     
-    for filename in required_files:
+    for filename in required_files + optional_files:
         filepath = data_dir / filename
-        if filepath.exists():
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                print(f"✅ {filename} exists and is valid JSON")
-            except json.JSONDecodeError:
-                print(f"❌ {filename} exists but has invalid JSON")
-                all_good = False
-        else:
+        # Read directly instead of probing with exists() first
+        try:
+            data = _loads(filepath.read_bytes())
+            print(f"✅ {filename} exists and is valid JSON")
+        except FileNotFoundError:
+            if filename in optional_files:
+                print(f"ℹ️ {filename} not written (optional, use --debug-statements)")
+                continue
             print(f"❌ {filename} does not exist")
             all_good = False
+        except json.JSONDecodeError:
+            print(f"❌ {filename} exists but has invalid JSON")
+            all_good = False
     
     return all_good
 
@@ -123,28 +143,27 @@ def test_scoring_files():
     
     for filename in scoring_files:
         filepath = data_dir / filename
-        if filepath.exists():
-            print(f"✅ {filename} exists")
-            
-            if filename.endswith('.json'):
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    print(f"   - Valid JSON with {len(data)} items")
-                except json.JSONDecodeError:
-                    print(f"   - ❌ Invalid JSON")
-                    all_good = False
-            elif filename.endswith('.csv'):
-                try:
-                    with open(filepath, 'r') as f:
-                        lines = f.readlines()
-                    print(f"   - CSV with {len(lines)} lines")
-                except Exception as e:
-                    print(f"   - ❌ Error reading CSV: {e}")
-                    all_good = False
-        else:
+        # Read directly instead of probing with exists() first
+        try:
+            raw = filepath.read_bytes()
+        except FileNotFoundError:
             print(f"❌ {filename} does not exist")
             all_good = False
+            continue
+        
+        print(f"✅ {filename} exists")
+        
+        if filename.endswith('.json'):
+            try:
+                data = _loads(raw)
+                print(f"   - Valid JSON with {len(data)} items")
+            except json.JSONDecodeError:
+                print(f"   - ❌ Invalid JSON")
+                all_good = False
+        elif filename.endswith('.csv'):
+            # Count line endings in the raw bytes; a final unterminated line still counts
+            line_count = raw.count(b"\n") + (bool(raw) and not raw.endswith(b"\n"))
+            print(f"   - CSV with {line_count} lines")
     
     return all_good
 
@@ -160,25 +179,23 @@ def main():
         ("Scoring Files", test_scoring_files)
     ]
     
-    results = {}
+    results = []
     
     for test_name, test_func in tests:
         print(f"\n🔬 {test_name}")
-        results[test_name] = test_func()
+        results.append((test_name, bool(test_func())))
     
     print("\n" + "=" * 55)
     print("📊 TEST SUMMARY")
     print("=" * 55)
     
-    passed = 0
     total = len(tests)
     
-    for test_name, result in results.items():
-        status = "PASS" if result else "FAIL" 
-        emoji = "✅" if result else "❌"
+    for test_name, result in results:
+        emoji, status = _STATUS[result]
         print(f"{emoji} {test_name}: {status}")
-        if result:
-            passed += 1
+    
+    passed = sum(result for _, result in results)
     
     print(f"\n🎯 Overall: {passed}/{total} tests passed")
     
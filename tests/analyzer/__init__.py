@@ -1 +0,0 @@
-# Test directory for analyzer package
\ No newline at end of file
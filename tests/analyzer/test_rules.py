@@ -2,16 +2,21 @@
 Unit tests for analyzer rules and core functionality.
 """
 
-import pytest
-import sys
-from pathlib import Path
+from datetime import datetime
 
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
 
-from analyzer import evaluate
+from analyzer import evaluate, get_rules_fingerprint
+from analyzer.all_rules import get_all_rule_functions
 from analyzer.id import contradiction_id
+from analyzer.rules_daterange import _parse_date
+
+# Types the multi-rule integration fixture must produce
+_EXPECTED_CONTRADICTION_TYPES = frozenset({
+    'presence_absence_conflict',
+    'event_date_disagreement',
+    'numeric_amount_mismatch',
+})
 
 class TestAnalyzerRules:
     """Test cases for individual analyzer rules."""
@@ -101,43 +106,56 @@ class TestAnalyzerRules:
         assert conflict['amount_b'] in [1000, 1500]
         assert conflict['amount_a'] != conflict['amount_b']
 
+class TestDateRangeParsing:
+    """Test cases for date parsing in the date range rule."""
+    
+    @pytest.mark.parametrize("date_str, expected", [
+        ('2024-01-15', datetime(2024, 1, 15)),
+        ('01/15/2024', datetime(2024, 1, 15)),
+        ('2024/01/15', datetime(2024, 1, 15)),
+        ('2024-1-5', datetime(2024, 1, 5)),
+        ('2024-02-30', None),
+        ('\u0662\u0660\u0662\u0664-\u0660\u0661-\u0661\u0665', None),
+        ('\uff12\uff10\uff12\uff14-\uff10\uff11-\uff11\uff15', None),
+        (None, None),
+    ])
+    def test_parse_date_matches_strptime(self, date_str, expected):
+        """Test the ISO fast path accepts exactly what the strptime formats accept."""
+        assert _parse_date(date_str) == expected
+
 class TestContradictionId:
     """Test cases for contradiction ID generation."""
     
-    def test_id_symmetry(self):
-        """Test that contradiction_id(a,b) == contradiction_id(b,a)."""
-        stmt_a = {'id': 'statement_1', 'content': 'test'}
-        stmt_b = {'id': 'statement_2', 'content': 'test'}
-        
+    @pytest.mark.parametrize("stmt_a, stmt_b, stmt_c", [
+        ({'id': 'statement_1', 'content': 'test'}, {'id': 'statement_2', 'content': 'test'}, {'id': 'statement_3'}),
+        ({'id': 'stmt_2'}, {'id': 'stmt_10'}, {'id': 'stmt_1'}),
+        ({'id': 'a|b'}, {'id': 'c'}, {'id': 'a'}),
+        ({'event': 'meeting', 'present': True}, {'event': 'meeting', 'present': False}, 'plain statement'),
+    ])
+    def test_id_properties(self, stmt_a, stmt_b, stmt_c):
+        """Test contradiction_id is symmetric, deterministic, and distinct per pair."""
         id_ab = contradiction_id(stmt_a, stmt_b)
-        id_ba = contradiction_id(stmt_b, stmt_a)
         
-        assert id_ab == id_ba, f"ID symmetry failed: {id_ab} != {id_ba}"
+        assert id_ab == contradiction_id(stmt_b, stmt_a), "ID symmetry failed"
+        assert id_ab == contradiction_id(stmt_a, stmt_b), "ID not deterministic"
+        assert id_ab != contradiction_id(stmt_a, stmt_c), "Different pairs should have different IDs"
     
-    def test_id_deterministic(self):
-        """Test that contradiction_id produces consistent results."""
-        stmt_a = {'id': 'statement_1'}
-        stmt_b = {'id': 'statement_2'}
-        
-        id_1 = contradiction_id(stmt_a, stmt_b)
-        id_2 = contradiction_id(stmt_a, stmt_b)
-        
-        assert id_1 == id_2, f"ID not deterministic: {id_1} != {id_2}"
-    
-    def test_id_different_for_different_statements(self):
-        """Test that different statement pairs produce different IDs."""
-        stmt_a = {'id': 'statement_1'}
-        stmt_b = {'id': 'statement_2'} 
-        stmt_c = {'id': 'statement_3'}
-        
-        id_ab = contradiction_id(stmt_a, stmt_b)
-        id_ac = contradiction_id(stmt_a, stmt_c)
+    def test_id_format(self):
+        """Test IDs are 12-character lowercase hex digests."""
+        cid = contradiction_id({'id': 'statement_1'}, {'id': 'statement_2'})
         
-        assert id_ab != id_ac, f"Different pairs should have different IDs: {id_ab} == {id_ac}"
+        assert len(cid) == 12
+        assert all(ch in '0123456789abcdef' for ch in cid)
 
 class TestAnalyzerIntegration:
     """Integration tests for the analyzer system."""
     
+    def test_rule_discovery_is_cached(self):
+        """Test rule discovery and the fingerprint are computed once and reused."""
+        assert get_all_rule_functions() is get_all_rule_functions()
+        assert isinstance(get_all_rule_functions(), tuple)
+        assert get_rules_fingerprint() is get_rules_fingerprint()
+    
     def test_evaluate_no_statements(self):
         """Test evaluate with empty statement list."""
         contradictions = evaluate([])
@@ -166,7 +184,8 @@ class TestAnalyzerIntegration:
         real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
         assert len(real_contradictions) == 0
     
-    def test_evaluate_multiple_contradiction_types(self):
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_evaluate_multiple_contradiction_types(self, parallel):
         """Test evaluate can detect multiple types of contradictions."""
         statements = [
             # Presence conflict
@@ -180,11 +199,22 @@ class TestAnalyzerIntegration:
             {'id': '6', 'event': 'payment', 'amount': 200, 'currency': 'USD'}
         ]
         
-        contradictions = evaluate(statements)
-        real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
+        contradictions = evaluate(statements, parallel=parallel)
+        
+        # Should detect all three types (engine errors never count)
+        types_found = {c['type'] for c in contradictions} - {'__engine_error__'}
         
-        # Should detect all three types
-        types_found = set(c['type'] for c in real_contradictions)
-        expected_types = {'presence_absence_conflict', 'event_date_disagreement', 'numeric_amount_mismatch'}
+        assert _EXPECTED_CONTRADICTION_TYPES <= types_found, f"Missing contradiction types. Found: {types_found}, Expected: {set(_EXPECTED_CONTRADICTION_TYPES)}"
+    
+    def test_evaluate_parallel_matches_sequential(self):
+        """Test the thread-pool dispatch returns the same results in the same order."""
+        statements = [
+            {'id': '1', 'event': 'mtg', 'party': 'John', 'present': True, 'location': 'Office A'},
+            {'id': '2', 'event': 'mtg', 'party': 'John', 'present': False, 'location': 'Office B'},
+            {'id': '3', 'event': 'incident', 'date': '2024-01-01'},
+            {'id': '4', 'event': 'incident', 'date': '2024-01-02'},
+            {'id': '5', 'case': 'case_001', 'status': 'ACTIVE'},
+            {'id': '6', 'case': 'case_001', 'status': 'CLOSED'}
+        ]
         
-        assert expected_types.issubset(types_found), f"Missing contradiction types. Found: {types_found}, Expected: {expected_types}"
\ No newline at end of file
+        assert evaluate(statements, parallel=True) == evaluate(statements)
@@ -62,8 +62,9 @@ def test_contradiction_detection():
     contradictions = evaluate(statements)
     
     # Separate real contradictions from engine errors
-    real_contradictions = [c for c in contradictions if c.get('type') != '__engine_error__']
-    engine_errors = [c for c in contradictions if c.get('type') == '__engine_error__']
+    real_contradictions, engine_errors = [], []
+    for c in contradictions:
+        (engine_errors if c.get('type') == '__engine_error__' else real_contradictions).append(c)
     
     print(f"✅ Found {len(real_contradictions)} contradictions")
     
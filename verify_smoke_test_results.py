@@ -23,11 +23,15 @@ def main():
     expected_files = {
         "run_meta.json": "Run metadata from analysis",
         "contradictions.json": "Raw contradictions from evaluation", 
-        "statements_debug.json": "Debug statements used in test",
         "contradictions_scored.json": "Scored contradictions",
         "contradictions_scored.csv": "CSV export of scored contradictions"
     }
     
+    # Only written by run_analysis.py --debug-statements
+    optional_files = {
+        "statements_debug.json": "Debug statements used in test"
+    }
+    
     print(f"\n📁 Checking {len(expected_files)} expected output files...")
     
     all_files_present = True
@@ -44,6 +48,16 @@ def main():
             file_info[filename] = {"exists": False, "size": 0}
             all_files_present = False
     
+    for filename, description in optional_files.items():
+        filepath = output_dir / filename
+        if filepath.exists():
+            size = filepath.stat().st_size
+            print(f"✅ {filename} - {size} bytes - {description}")
+            file_info[filename] = {"exists": True, "size": size}
+        else:
+            print(f"ℹ️ {filename} - not written (optional, --debug-statements) - {description}")
+            file_info[filename] = {"exists": False, "size": 0}
+    
     if not all_files_present:
         print("\n❌ Some files are missing. Pipeline may not have run correctly.")
         return 1